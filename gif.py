@@ -1,8 +1,43 @@
-def load_file(file_name: str) -> tuple[bytes, str]:
+import ctypes
+import mmap
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Union
+
+
+# bytes-like objects the extract functions read from, such as the memory map returned by load_file()
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# optional native LZW decoder built from lzw_gif.c by make -> the pure Python _lzw_decode() is used without it
+try:
+    _lzw_gif = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "lzw_gif.so"))
+except OSError:
+    _lzw_gif = None
+else:
+    _lzw_gif.lzw_decode.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t]
+    _lzw_gif.lzw_decode.restype = ctypes.c_ssize_t
+
+
+@dataclass
+class GifContext:
+    """
+    Values shared by the image extraction steps, parsed from data in a single pass by _gif_context().\n
+    gc_map holds the colours of the global colour table and image_desc_offset locates the first image descriptor. The
+    image descriptor itself is only read by _decode_frame().
+    """
+    gc_map: list[list[int, int, int], ...]
+    image_desc_offset: int
+
+
+def load_file(file_name: str) -> tuple[BytesLike, str]:
     """
     Takes the file name of a .gif file and return a data object and a description line. \n
-    If the GIF file was found, its entire content should be transferred into data. If the file was not found, return an
-    empty bytes() \n
+    If the GIF file was found, its entire content should be available through data, which is a read-only memory map of
+    the file so pages are only read in as they are parsed. The caller owns the map and should close it with
+    data.close(), or use it in a with block, once done with it. bytes(data) gives a bytes copy where one is needed. An
+    empty file gives an empty bytes(). If the file was not found, return an empty bytes() \n
     If the file was opened, info returns the file_name. If the file was not found, info return 'file not found'. \n
     :param file_name: path to the .gif file
     :return: tuple of (data, info)
@@ -10,7 +45,11 @@ def load_file(file_name: str) -> tuple[bytes, str]:
     # open file for reading using binary mode
     try:
         with open(file_name, "rb") as fh:
-            data = fh.read()
+            # the map stays valid after the file is closed, empty files cannot be mapped
+            if os.fstat(fh.fileno()).st_size:
+                data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = bytes()
         info = file_name
     # if not found return "file not found" and empty bytes()
     except FileNotFoundError:
@@ -19,18 +58,18 @@ def load_file(file_name: str) -> tuple[bytes, str]:
     return data, info
 
 
-def extract_header(data: bytes) -> str:
+def extract_header(data: BytesLike) -> str:
     """
     Extract the GIF header from data.\n
     :param data: obtained using load_file()
     :return: header
     """
     # the header is decoded according to ascii
-    header = data[0:6].decode("ascii")
+    header = str(data[0:6], "ascii")
     return header
 
 
-def extract_screen_descriptor(data: bytes) -> tuple[int, int, int, int, int, int, int, int]:
+def extract_screen_descriptor(data: BytesLike) -> tuple[int, int, int, int, int, int, int, int]:
     """
     Extract the screen descriptors from data.\n
     :param data: obtained using load_file()
@@ -44,188 +83,438 @@ def extract_screen_descriptor(data: bytes) -> tuple[int, int, int, int, int, int
     bcolour_i = data[11]
     px_ratio = data[12]
 
-    # converting packed field byte into bits
-    packed_field = bin(data[10])[2:]
-    # reading packed field bits
-    gc_fl = int(packed_field[0])
-    cr = int(packed_field[1:4], base=2)
-    sort_fl = int(packed_field[4])
-    gc_size = int(packed_field[5:8], base=2)
+    # reading packed field bits with shifts and masks, most significant bit first
+    packed_field = data[10]
+    gc_fl = (packed_field >> 7) & 1
+    cr = (packed_field >> 4) & 0b111
+    sort_fl = (packed_field >> 3) & 1
+    gc_size = packed_field & 0b111
     return width, height, gc_fl, cr, sort_fl, gc_size, bcolour_i, px_ratio
 
 
-def extract_global_colour_table(data: bytes) -> list[list[int, int, int], ...]:
+def extract_global_colour_table(data: BytesLike) -> list[list[int, int, int], ...]:
     """
     Extract the global colour map from data.\n
     :param data: obtained using load_file()
     :return: gc_map - contains the global colour table as a 2-dimensional array with each row representing a different
     colour in the table and each column representing the colour, such as red, green, and blue.
     """
-    # get table size from logical screen descriptor and slicing data
+    # get table size from logical screen descriptor
     table_size = 3 * 2 ** (extract_screen_descriptor(data)[5] + 1)
-    table_bytes = data[13:13 + table_size]
+    return _read_colour_table(data, 13, table_size)
 
-    # create table of rgb values
-    gc_map = []
-    for c in range(0, len(table_bytes), 3):
-        # pull rgb values 3 bytes at a time
-        color = [n for n in table_bytes[c:c+3]]
-        gc_map.append(color)
-    return gc_map
+
+def _read_colour_table(data: BytesLike, start: int, table_size: int) -> list[list[int, int, int], ...]:
+    """
+    Read a colour table of table_size bytes beginning at start.\n
+    :param data: obtained using load_file()
+    :param start: index of the first byte of the colour table
+    :param table_size: length of the colour table in bytes
+    :return: colour table with one [red, green, blue] row per colour
+    """
+    # create table of rgb values -> zip pulls rgb values 3 bytes at a time from one iterator
+    table_bytes = iter(memoryview(data)[start:start + table_size])
+    colour_table = [list(rgb) for rgb in zip(table_bytes, table_bytes, table_bytes)]
+    return colour_table
 
 
-def extract_image_descriptor(data: bytes) -> tuple[int, int, int, int, int, int, int, int, int]:
+def extract_image_descriptor(data: BytesLike) -> tuple[int, int, int, int, int, int, int, int, int]:
     """
     Extract the image descriptors from data.\n
     :param data: obtained using load_file()
     :return: left, top, width, height, lc_fl, itl_fl, sort_fl, res, and lc_size - values returned are as specified in
     the GIF documentation.
     """
-    # locate image descriptor start byte -> should be the first 2C byte after gc_map
     table_size = 3 * 2 ** (extract_screen_descriptor(data)[5] + 1)
-    search_start = 13 + table_size
-    start = data.find(b"\x2c", search_start)
+    start = _find_image_descriptor(data, 13 + table_size)
+    if start == -1:
+        raise ValueError("no image descriptor found in data")
+    return _read_image_descriptor(data, start)
+
 
+def _find_image_descriptor(data: BytesLike, start: int) -> int:
+    """
+    Locate the next image descriptor in data by stepping over extension blocks.\n
+    :param data: obtained using load_file()
+    :param start: index of the first block to look at, such as the byte after the global colour table
+    :return: index of the image separator byte that starts the image descriptor, or -1 if the trailer, an unknown block
+    or the end of data is reached first
+    """
+    pos = start
+    end = len(data)
+    while pos < end:
+        # 21 byte starts an extension -> skip introducer and label, then its chain of data sub blocks
+        if data[pos] == 0x21:
+            pos += 2
+            while pos < end and data[pos] != 0:
+                pos += data[pos] + 1
+            pos += 1
+        # 2C byte starts an image descriptor, which must be whole
+        elif data[pos] == 0x2c:
+            return pos if pos + 10 <= end else -1
+        else:
+            return -1
+    return -1
+
+
+def _read_image_descriptor(data: BytesLike, start: int) -> tuple[int, int, int, int, int, int, int, int, int]:
+    """
+    Read the image descriptor beginning at start.\n
+    :param data: obtained using load_file()
+    :param start: index of the image separator byte
+    :return: left, top, width, height, lc_fl, itl_fl, sort_fl, res, and lc_size
+    """
     # read two-byte descriptors using little-endian format
     left = int.from_bytes(data[start + 1:start + 3], "little")
     top = int.from_bytes(data[start + 3:start + 5], "little")
     width = int.from_bytes(data[start + 5:start + 7], "little")
     height = int.from_bytes(data[start + 7:start + 9], "little")
 
-    # find packed field descriptors
-    packed_field = bin(data[start + 9])[2:]
-    # if packed field is 0, then all fields are 0
-    if packed_field == "0":
-        lc_fl = itl_fl = sort_fl = res = lc_size = 0
-    # read packed field bits
-    else:
-        lc_fl = int(packed_field[0])
-        itl_fl = int(packed_field[1])
-        sort_fl = int(packed_field[2])
-        res = int(packed_field[2:4], base=2)
-        lc_size = int(packed_field[4:7], base=2)
+    # read packed field bits with shifts and masks, most significant bit first
+    packed_field = data[start + 9]
+    lc_fl = (packed_field >> 7) & 1
+    itl_fl = (packed_field >> 6) & 1
+    sort_fl = (packed_field >> 5) & 1
+    res = (packed_field >> 3) & 0b11
+    lc_size = packed_field & 0b111
     return left, top, width, height, lc_fl, itl_fl, sort_fl, res, lc_size
 
 
-def extract_image(data: bytes) -> list[list[list[int, ...], ...], ...]:
+def _gif_context(data: BytesLike) -> GifContext:
     """
-    Extract the image from data.
+    Parse the global colour table and locate the first image in one pass from the start of data.\n
     :param data: obtained using load_file()
-    :return: image - The return should be a 3-dimensional array containing the decompressed GIF image. The first
-    dimension should be rows, the second dimension should be columns, and the third dimension should be the colours,
-    such as red, green, blue.
+    :return: context - see GifContext
     """
-    # locate image start -> 10 bytes after start of image descriptor
     table_size = 3 * 2 ** (extract_screen_descriptor(data)[5] + 1)
-    search_start = 13 + table_size
-    start = data.find(b"\x2c", search_start) + 10
-    image_bytes = data[start:]
-
-    # get minimum code size from byte 0 of image data
-    min_code_size = image_bytes[0]
-    # starting code size is one more than min_code_size
-    code_size = min_code_size + 1
-
-    # generate data_stream to read variable length codes -> combine all data from all data sub blocks
-    # equivalent to removing the data sub block length bytes
-    # looping through data sub blocks and setting default values
-    sub_blocks = []
-    sub_block_start = 1
-    sub_block_length = image_bytes[sub_block_start]
-    data_stream = []
-    # sub_block_length = 0 marks end of image data
+    gc_map = _read_colour_table(data, 13, table_size)
+    image_desc_offset = _find_image_descriptor(data, 13 + table_size)
+    if image_desc_offset == -1:
+        raise ValueError("no image descriptor found in data")
+    return GifContext(gc_map, image_desc_offset)
+
+
+def _join_sub_blocks(data: BytesLike, start: int) -> bytearray:
+    """
+    Combine all data from a chain of data sub blocks -> equivalent to removing the data sub block length bytes.\n
+    :param data: obtained using load_file()
+    :param start: index of the length byte of the first data sub block
+    :return: payload - contents of every data sub block in order
+    """
+    # first pass only reads length bytes to size payload, sub_block_length = 0 marks end of the chain
+    total = 0
+    sub_block_start = start
+    sub_block_length = data[sub_block_start]
     while sub_block_length != 0:
-        sub_block = image_bytes[sub_block_start + 1: sub_block_start + sub_block_length + 1]
-        # turn sub block data into series of bits
-        string_list = []
-        for byte in sub_block:
-            long_byte = bin(byte)[2:]
-            # force long_byte to be 8-bit
-            if len(long_byte) < 8:
-                long_byte = (8 - len(bin(byte)[2:])) * "0" + long_byte
-            # bytes are added with the least significant bit first
-            string_list.append(long_byte[::-1])
-        stream = "".join(string_list)
-        data_stream.append(stream)
-
-        # getting next sub_block start index and length
+        total += sub_block_length
         sub_block_start += sub_block_length + 1
-        sub_block_length = image_bytes[sub_block_start]
-    data_stream = "".join(data_stream)
+        sub_block_length = data[sub_block_start]
 
+    # second pass copies each sub block into place through memoryviews, without intermediate slices
+    payload = bytearray(total)
+    source = memoryview(data)
+    target = memoryview(payload)
+    pos = 0
+    sub_block_start = start
+    sub_block_length = data[sub_block_start]
+    while sub_block_length != 0:
+        target[pos:pos + sub_block_length] = source[sub_block_start + 1:sub_block_start + sub_block_length + 1]
+        pos += sub_block_length
+        sub_block_start += sub_block_length + 1
+        sub_block_length = data[sub_block_start]
+    return payload
+
+
+def _lzw_decode(payload: bytes, min_code_size: int, size: int) -> bytearray:
+    """
+    Decompress the LZW code stream of an image.\n
+    :param payload: image data with the data sub block length bytes removed
+    :param min_code_size: LZW minimum code size read from the first byte of the image data
+    :param size: number of pixels in the image, width * height
+    :return: image_data - colour table index of every pixel in the image
+    """
     # LZW Algorithm main loop works as follows:
-    # let current_code be the next code chunk in data_stream
+    # let current_code be the next code chunk in payload
     # if current_code in code_table:
-    # A) add current_code color(s) to image_data
-    # B) let b be the first color from current_code
-    # C) add (previous_code + b) colors to code_table
+    # A) add current_code index(es) to image_data
+    # B) let b be the first index from current_code
+    # C) add (previous_code + b) indexes to code_table
     # if current_code not in code_table:
-    # A) let b be the first color from previous_code
-    # B) add (previous_code + b) colors to image_data
-    # C) add (previous_code + b) colors to code_table
-    # for first "color" code -> append current_code color to image_data, then start main loop
-    # keep count of codes read when looping through data stream
-    start_b = 0
-    count = 0
-    gc_map = extract_global_colour_table(data)  # fresh color table
-    cc_index = len(gc_map)  # clear code index
-    image_data = []
+    # A) let b be the first index from previous_code
+    # B) add (previous_code + b) indexes to image_data
+    # C) add (previous_code + b) indexes to code_table
+    # for first "color" code after CC -> append current_code index to image_data, then continue main loop
+    # the code table holds colour table indexes, colours are only looked up once decoding is done
+    # a stream that ends without EOI keeps the indexes decoded so far, indexes past size are dropped and any other
+    # invalid stream raises ValueError -> same as lzw_decode() in lzw_gif.c
+    # indexes must fit in a byte
+    if not 2 <= min_code_size <= 8:
+        raise ValueError("invalid LZW image data")
+    # codes are packed least significant bit first, so bytes are shifted into an integer bit buffer
+    # above the bits already held and codes are masked off the bottom
+    bit_buffer = 0
+    bit_count = 0
+    pos = 0
+    end = len(payload)
+    cc_index = 1 << min_code_size  # clear code index
+    # code table entry k is stored as (entry prefix[k]) + [suffix[k]], with -1 marking a single index entry
+    # -> GIF codes are at most 12 bits, so the table never grows past 4096 entries and prefixes fit in 16-bit slots
+    prefix = array("h", [-1]) * 4096
+    suffix = bytearray(4096)
+    suffix[:cc_index] = range(cc_index)
+    # entries are read back to front, so a stack is used to emit them in order
+    stack = bytearray()
+    # image size is known up front, so indexes are written into a preallocated buffer at out_pos
+    image_data = bytearray(size)
+    out_pos = 0
+    # the stream is decoded as if it starts with CC, even when it does not
+    current_code = cc_index
+    # code_size only changes on CC or once threshold codes are read, so each pass of the outer loop decodes a run of
+    # codes that all share one code_size and mask -> the inner loop never recomputes them
     while True:
-        # chunk of bits is reversed after slicing to read correctly
-        reversed_order = data_stream[start_b:start_b + code_size]
-        current_code = int(reversed_order[::-1], base=2)
-        start_b += code_size
-
-        # CC - initialize code table color map
+        # CC - drop every entry after CC and EOI
         if current_code == cc_index:
-            # get global color table
-            code_table = [[c] for c in gc_map]
-            # add special lzw codes - Clear Code and End Of Information
-            code_table.extend(["CC", "EOI"])
-            first = True  # will treat next code as first "color" code
-            # reset code_size and count
-            count = 0
+            next_code = cc_index + 2
+            # reset code_size and threshold, CC is the first code counted
+            # -> count of codes read, code_size grows once count reaches threshold
+            count = 1
             code_size = min_code_size + 1
-        # EOI - break out of loop
-        elif current_code == cc_index + 1:
-            break
-        # code is in code table
-        elif current_code < len(code_table):
-            # add current_code color(s) to image data
-            current_color = code_table[current_code]
-            image_data.extend(current_color)
-            # if first code do not change code table
-            if first:
-                first = False
-            # else create new code table entry
+            threshold = 1 << min_code_size
+            # first "color" code after CC is read here, it is a single index and does not change the code table
+            # -> a repeated CC only resets again, so keep reading until another code comes
+            while current_code == cc_index:
+                while bit_count < code_size:
+                    if pos == end:
+                        return image_data
+                    bit_buffer |= payload[pos] << bit_count
+                    bit_count += 8
+                    pos += 1
+                current_code = bit_buffer & ((1 << code_size) - 1)
+                bit_buffer >>= code_size
+                bit_count -= code_size
+            if current_code == cc_index + 1:
+                return image_data
+            if current_code > cc_index:
+                raise ValueError("invalid LZW image data")
+            # image is full -> indexes past size are dropped
+            if out_pos == size:
+                return image_data
+            image_data[out_pos] = current_code
+            out_pos += 1
+            count += 1
+            previous_code = current_code
+
+        mask = (1 << code_size) - 1
+        # codes left until code_size grows, 12-bit codes never grow
+        remaining = threshold - count if code_size < 12 else -1
+        while remaining != 0:
+            # refill bit buffer until it holds a whole code, data running out before EOI ends decoding
+            while bit_count < code_size:
+                if pos == end:
+                    return image_data
+                bit_buffer |= payload[pos] << bit_count
+                bit_count += 8
+                pos += 1
+            current_code = bit_buffer & mask
+            bit_buffer >>= code_size
+            bit_count -= code_size
+
+            # CC - start a new run at the reset code_size
+            if current_code == cc_index:
+                break
+            # EOI - decoding is done
+            elif current_code == cc_index + 1:
+                return image_data
+            # code is in code table -> walk the prefix chain of current_code
+            elif current_code < next_code:
+                stack.clear()
+                code = current_code
+                while code != -1:
+                    stack.append(suffix[code])
+                    code = prefix[code]
+                stack.reverse()
+                b = stack[0]
+            # code is not in code table -> it is previous_code + b
+            elif current_code == next_code:
+                stack.clear()
+                code = previous_code
+                while code != -1:
+                    stack.append(suffix[code])
+                    code = prefix[code]
+                stack.reverse()
+                b = stack[0]
+                stack.append(b)
             else:
-                b = current_color[0]
-                new = code_table[previous_code] + [b]
-                code_table.append(new)
-        # code is not in code table
-        else:
-            # update image_data and code_table
-            b = code_table[previous_code][0]
-            new = code_table[previous_code] + [b]
-            image_data.extend(new)
-            code_table.append(new)
-
-        # saving previous code and keeping count
-        count += 1
-        previous_code = current_code
-        # adjusting code size
-        if count == 2 ** (code_size - 1):
+                raise ValueError("invalid LZW image data")
+
+            # add index(es) to image data, once the image is full indexes past size are dropped
+            if out_pos + len(stack) > size:
+                image_data[out_pos:] = stack[:size - out_pos]
+                return image_data
+            image_data[out_pos:out_pos + len(stack)] = stack
+            out_pos += len(stack)
+            # create new code table entry
+            if next_code < 4096:
+                prefix[next_code] = previous_code
+                suffix[next_code] = b
+                next_code += 1
+
+            # saving previous code and counting down the run
+            previous_code = current_code
+            remaining -= 1
+
+        # adjusting code size once the run is used up -> codes are never longer than 12 bits
+        if remaining == 0:
             count = 0
             code_size += 1
+            threshold <<= 1
+
+
+def _lzw_decode_native(payload: bytearray, min_code_size: int, size: int) -> bytearray:
+    """
+    Decompress the LZW code stream of an image with lzw_decode() from lzw_gif.c.\n
+    :param payload: image data with the data sub block length bytes removed
+    :param min_code_size: LZW minimum code size read from the first byte of the image data
+    :param size: number of pixels in the image, width * height
+    :return: image_data - colour table index of every pixel in the image
+    """
+    # both buffers are passed to C without copying
+    image_data = bytearray(size)
+    source = (ctypes.c_char * len(payload)).from_buffer(payload)
+    target = (ctypes.c_char * size).from_buffer(image_data)
+    written = _lzw_gif.lzw_decode(source, len(payload), min_code_size, target, size)
+    del source, target
+    if written < 0:
+        raise ValueError("invalid LZW image data")
+    return image_data
+
+
+def extract_image(data: BytesLike) -> list[list[list[int, ...], ...], ...]:
+    """
+    Extract the image from data.
+    :param data: obtained using load_file()
+    :return: image - The return should be a 3-dimensional array containing the decompressed GIF image. The first
+    dimension should be rows, the second dimension should be columns, and the third dimension should be the colours,
+    such as red, green, blue.
+    """
+    # parse colour table and locate the image once, the image is decoded as the first frame so a local colour table is
+    # used the same way as in extract_frame()
+    context = _gif_context(data)
+    image = _decode_frame(data, context.image_desc_offset, context.gc_map)
+    return image
+
+
+def _decode_image(data: BytesLike, image_data_offset: int, width: int, height: int,
+                  colour_table: list[list[int, int, int], ...]) -> list[list[list[int, ...], ...], ...]:
+    """
+    Decompress the image data beginning at image_data_offset and look up its colours.\n
+    :param data: obtained using load_file()
+    :param image_data_offset: index of the LZW minimum code size byte of the image data
+    :param width: image width from the image descriptor
+    :param height: image height from the image descriptor
+    :param colour_table: colour table the image indexes refer to
+    :return: image - 3-dimensional array of rows, columns and red, green, blue colours
+    """
+    # get minimum code size from byte 0 of image data, data sub blocks follow it
+    min_code_size = data[image_data_offset]
+    payload = _join_sub_blocks(data, image_data_offset + 1)
+    if _lzw_gif is not None:
+        image_data = _lzw_decode_native(payload, min_code_size, width * height)
+    else:
+        image_data = _lzw_decode(payload, min_code_size, width * height)
 
-    # get image width and reshape image
-    width = extract_image_descriptor(data)[2]
-    image = []
-    row = []
-    for index, color in enumerate(image_data, start=1):
-        row.append(color)
-        # create new row after width is satisfied
-        if index % width == 0:
-            image.append(row)
-            row = []
+    # map colour indexes through the colour table one row of width pixels at a time
+    # the table is padded with black to 256 entries, so every index byte has a colour even when the image uses codes
+    # past the end of a small colour table
+    lut = colour_table + [[0, 0, 0]] * (256 - len(colour_table))
+    lookup = lut.__getitem__
+    # an image without columns has no rows
+    if width == 0:
+        return []
+    # rows are memoryview slices, so no row of indexes is copied
+    rows = memoryview(image_data)
+    image = [list(map(lookup, rows[r:r + width])) for r in range(0, width * height, width)]
     return image
+
+
+def _find_frames(data: BytesLike, start: int) -> list[int, ...]:
+    """
+    Locate every image in data in a single pass over its blocks.\n
+    :param data: obtained using load_file()
+    :param start: index of the first image separator byte, or -1 if data has no image
+    :return: frames - index of the image separator byte of each image
+    """
+    frames = []
+    pos = start
+    end = len(data)
+    while pos != -1:
+        start = pos
+        packed_field = data[pos + 9]
+        pos += 10
+        # skip local colour table if the image has one
+        if packed_field >> 7:
+            pos += 3 * 2 ** ((packed_field & 0b111) + 1)
+        # skip minimum code size byte and the chain of data sub blocks
+        pos += 1
+        while pos < end and data[pos] != 0:
+            pos += data[pos] + 1
+        # an image cut off before its block terminator is not a frame
+        if pos >= end:
+            break
+        frames.append(start)
+        pos = _find_image_descriptor(data, pos + 1)
+    return frames
+
+
+def _decode_frame(data: BytesLike, start: int,
+                  gc_map: list[list[int, int, int], ...]) -> list[list[list[int, ...], ...], ...]:
+    """
+    Decode the image whose image descriptor begins at start, using its local colour table if it has one.\n
+    :param data: obtained using load_file()
+    :param start: index of the image separator byte
+    :param gc_map: global colour table, used when the image has no local colour table
+    :return: image - 3-dimensional array of rows, columns and red, green, blue colours
+    """
+    _, _, width, height, lc_fl, _, _, _, lc_size = _read_image_descriptor(data, start)
+    image_data_offset = start + 10
+    colour_table = gc_map
+    # local colour table sits between the image descriptor and the image data
+    if lc_fl:
+        table_size = 3 * 2 ** (lc_size + 1)
+        colour_table = _read_colour_table(data, image_data_offset, table_size)
+        image_data_offset += table_size
+    return _decode_image(data, image_data_offset, width, height, colour_table)
+
+
+def extract_frame(data: BytesLike, frame_idx: int) -> list[list[list[int, ...], ...], ...]:
+    """
+    Extract a single frame of an animated GIF from data.\n
+    :param data: obtained using load_file()
+    :param frame_idx: position of the frame in the file, starting at 0
+    :return: image - 3-dimensional array of rows, columns and red, green, blue colours, as returned by extract_image()
+    """
+    context = _gif_context(data)
+    start = _find_frames(data, context.image_desc_offset)[frame_idx]
+    return _decode_frame(data, start, context.gc_map)
+
+
+def extract_frames(data: BytesLike) -> list[list[list[list[int, ...], ...], ...], ...]:
+    """
+    Extract every frame of an animated GIF from data.\n
+    Frames are decoded independently. When the native decoder from lzw_gif.c is loaded, frames are decoded in a pool of
+    threads, one frame per job. Otherwise they are decoded one after another. Only the LZW step in lzw_decode() runs
+    without holding the GIL. Joining the data sub blocks and building the rows of colour lists still hold it, and they
+    take most of the time on large frames, so the threads mostly overlap the LZW step.\n
+    :param data: obtained using load_file()
+    :return: frames - list of images in file order, each as returned by extract_image()
+    """
+    context = _gif_context(data)
+    frames = _find_frames(data, context.image_desc_offset)
+    workers = min(len(frames), os.cpu_count() or 1)
+    if _lzw_gif is None or workers <= 1:
+        return [_decode_frame(data, start, context.gc_map) for start in frames]
+
+    # threads share data, so no frame bytes or images are copied between workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        jobs = [executor.submit(_decode_frame, data, start, context.gc_map) for start in frames]
+        return [job.result() for job in jobs]
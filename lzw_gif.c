@@ -0,0 +1,124 @@
+/*
+ * Native GIF LZW decoder, loaded by gif.py through ctypes when it has been built.
+ * Build next to gif.py with:
+ *     make
+ * Without lzw_gif.so, gif.py decodes with its pure Python _lzw_decode().
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#define MAX_CODES 4096
+
+/*
+ * Decompress the LZW code stream of an image.
+ * in / in_len: image data with the data sub block length bytes removed
+ * min_code_size: LZW minimum code size read from the first byte of the image data
+ * out / out_len: buffer receiving one colour table index per pixel, width * height bytes
+ * return: number of indexes written to out, or -1 if the code stream is invalid -> ptrdiff_t, as width * height can
+ *         exceed INT_MAX
+ * A stream that ends without EOI keeps the indexes decoded so far, and indexes past out_len are dropped.
+ */
+ptrdiff_t lzw_decode(const uint8_t *in, size_t in_len, int min_code_size, uint8_t *out, size_t out_len)
+{
+    /* code table entry k is (entry prefix[k]) + suffix[k], first[k] and length[k] describe the whole entry */
+    uint16_t prefix[MAX_CODES];
+    uint8_t suffix[MAX_CODES];
+    uint8_t first[MAX_CODES];
+    uint16_t length[MAX_CODES];
+
+    /* indexes must fit in a byte */
+    if (min_code_size < 2 || min_code_size > 8)
+        return -1;
+
+    const int cc_index = 1 << min_code_size;
+    const int eoi_index = cc_index + 1;
+    for (int i = 0; i < cc_index; i++) {
+        prefix[i] = 0;
+        suffix[i] = (uint8_t)i;
+        first[i] = (uint8_t)i;
+        length[i] = 1;
+    }
+
+    int code_size = min_code_size + 1;
+    int next_code = cc_index + 2;
+    int previous_code = -1;
+    /* codes are packed least significant bit first into a 32-bit bit buffer */
+    uint32_t bit_buffer = 0;
+    int bit_count = 0;
+    size_t in_pos = 0;
+    size_t out_pos = 0;
+
+    for (;;) {
+        while (bit_count < code_size) {
+            if (in_pos == in_len)
+                return (ptrdiff_t)out_pos;
+            bit_buffer |= (uint32_t)in[in_pos++] << bit_count;
+            bit_count += 8;
+        }
+        int code = (int)(bit_buffer & ((1u << code_size) - 1));
+        bit_buffer >>= code_size;
+        bit_count -= code_size;
+
+        if (code == cc_index) {
+            code_size = min_code_size + 1;
+            next_code = cc_index + 2;
+            previous_code = -1;
+            continue;
+        }
+        if (code == eoi_index)
+            break;
+
+        int entry;
+        uint8_t b;
+        if (previous_code == -1) {
+            /* first code after CC is a single index and does not change the code table */
+            if (code >= cc_index)
+                return -1;
+            entry = code;
+            b = first[code];
+        } else if (code < next_code) {
+            entry = code;
+            b = first[code];
+        } else if (code == next_code && next_code < MAX_CODES) {
+            /* code is not in code table -> it is previous_code + first index of previous_code */
+            entry = -1;
+            b = first[previous_code];
+        } else {
+            return -1;
+        }
+
+        /* add entry to code table */
+        if (previous_code != -1 && next_code < MAX_CODES) {
+            prefix[next_code] = (uint16_t)previous_code;
+            suffix[next_code] = b;
+            first[next_code] = first[previous_code];
+            length[next_code] = length[previous_code] + 1;
+            next_code++;
+            if (next_code == (1 << code_size) && code_size < 12)
+                code_size++;
+        }
+        if (entry == -1)
+            entry = next_code - 1;
+
+        /* entries are read back to front, so they are written into out from their last index */
+        size_t n = length[entry];
+        int c = entry;
+        const int full = n > out_len - out_pos;
+        if (full) {
+            /* image is full -> indexes past out_len are dropped and decoding ends */
+            for (size_t skip = n - (out_len - out_pos); skip > 0; skip--)
+                c = prefix[c];
+            n = out_len - out_pos;
+        }
+        size_t i = out_pos + n;
+        while (i > out_pos) {
+            out[--i] = suffix[c];
+            c = prefix[c];
+        }
+        out_pos += n;
+        if (full)
+            break;
+        previous_code = code;
+    }
+    return (ptrdiff_t)out_pos;
+}
@@ -0,0 +1,288 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import gif
+
+
+def _pack_codes(codes: list[tuple[int, int], ...]) -> bytes:
+    """
+    Pack (code, code_size) pairs least significant bit first, as they appear in GIF image data.
+    """
+    bit_buffer = 0
+    bit_count = 0
+    for code, code_size in codes:
+        bit_buffer |= code << bit_count
+        bit_count += code_size
+    return bit_buffer.to_bytes((bit_count + 7) // 8, "little")
+
+
+def _lzw_encode(indexes: list[int, ...], min_code_size: int, clear_when_full: bool) -> bytes:
+    """
+    LZW encode indexes, either emitting CC when the code table fills up or carrying on with a full table.
+    """
+    cc_index = 1 << min_code_size
+    table = {(i,): i for i in range(cc_index)}
+    next_code = cc_index + 2
+    code_size = min_code_size + 1
+    codes = [(cc_index, code_size)]
+    entry = (indexes[0],)
+    for i in indexes[1:]:
+        if entry + (i,) in table:
+            entry += (i,)
+            continue
+        codes.append((table[entry], code_size))
+        if next_code < 4096:
+            table[entry + (i,)] = next_code
+            next_code += 1
+            # the decoder adds each entry one code later, so the code size grows one code later too
+            if next_code == (1 << code_size) + 1 and code_size < 12:
+                code_size += 1
+        elif clear_when_full:
+            codes.append((cc_index, code_size))
+            table = {(i,): i for i in range(cc_index)}
+            next_code = cc_index + 2
+            code_size = min_code_size + 1
+        entry = (i,)
+    codes.append((table[entry], code_size))
+    codes.append((cc_index + 1, code_size))
+    return _pack_codes(codes)
+
+
+def _build_gif(width: int, height: int, gc_size: int, min_code_size: int, payload: bytes) -> bytes:
+    """
+    Build a single image GIF with a grey global colour table of 2 ** (gc_size + 1) colours around payload.
+    """
+    colours = 2 ** (gc_size + 1)
+    data = bytearray(b"GIF89a")
+    data += width.to_bytes(2, "little") + height.to_bytes(2, "little") + bytes([0x80 | gc_size, 0, 0])
+    data += bytes(c * 255 // (colours - 1) for c in range(colours) for _ in range(3))
+    data += b"\x2c" + bytes(4) + width.to_bytes(2, "little") + height.to_bytes(2, "little") + b"\x00"
+    data.append(min_code_size)
+    for c in range(0, len(payload), 255):
+        data.append(len(payload[c:c + 255]))
+        data += payload[c:c + 255]
+    data += b"\x00\x3b"
+    return bytes(data)
+
+
+def _build_animation(width: int, height: int, frames: list[tuple[list[int, ...], bytes], ...]) -> bytes:
+    """
+    Build a GIF with a 4 colour grey global colour table and one image per (indexes, local_table) frame, where an empty
+    local_table means the frame uses the global colour table.
+    """
+    data = bytearray(_build_gif(width, height, 1, 2, b"")[:25])
+    for indexes, local_table in frames:
+        # graphic control extension before every frame, as animations have
+        data += b"\x21\xf9\x04\x00\x0a\x00\x00\x00"
+        packed_field = 0x81 if local_table else 0x00
+        data += b"\x2c" + bytes(4) + width.to_bytes(2, "little") + height.to_bytes(2, "little") + bytes([packed_field])
+        data += local_table
+        payload = _lzw_encode(indexes, 2, True)
+        data.append(2)
+        for c in range(0, len(payload), 255):
+            data.append(len(payload[c:c + 255]))
+            data += payload[c:c + 255]
+        data.append(0)
+    data += b"\x3b"
+    return bytes(data)
+
+
+class TestLoadFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_gif_file(self):
+        content = _build_gif(2, 1, 1, 2, _pack_codes([(4, 3), (1, 3), (2, 3), (5, 3)]))
+        file_name = os.path.join(self.directory.name, "image.gif")
+        with open(file_name, "wb") as fh:
+            fh.write(content)
+        data, info = gif.load_file(file_name)
+        with data:
+            self.assertEqual(info, file_name)
+            self.assertEqual(bytes(data), content)
+            self.assertEqual(gif.extract_header(data), "GIF89a")
+            self.assertEqual(gif.extract_image(data), [[[85, 85, 85], [170, 170, 170]]])
+        self.assertTrue(data.closed)
+
+    def test_empty_file(self):
+        file_name = os.path.join(self.directory.name, "empty.gif")
+        open(file_name, "wb").close()
+        self.assertEqual(gif.load_file(file_name), (b"", file_name))
+
+    def test_missing_file(self):
+        file_name = os.path.join(self.directory.name, "missing.gif")
+        self.assertEqual(gif.load_file(file_name), (b"", "file not found"))
+
+
+class TestDescriptors(unittest.TestCase):
+    def test_screen_descriptor_packed_field(self):
+        # 0x35 has no global colour table flag, so its bits start below the most significant bit
+        for packed_field, expected in ((0x35, (0, 3, 0, 5)), (0xf8, (1, 7, 1, 0)), (0x00, (0, 0, 0, 0))):
+            data = b"GIF89a" + b"\x03\x00\x02\x00" + bytes([packed_field, 1, 2])
+            self.assertEqual(gif.extract_screen_descriptor(data), (3, 2) + expected + (1, 2))
+
+    def test_image_descriptor_packed_field(self):
+        # packed fields below 0x80 have no local colour table flag, res sits between the sort flag and lc_size
+        for packed_field, expected in ((0x65, (0, 1, 1, 0, 5)), (0x98, (1, 0, 0, 3, 0)), (0x20, (0, 0, 1, 0, 0))):
+            data = b"GIF89a" + bytes(7) + bytes(6)
+            data += b"\x2c\x01\x00\x02\x00\x03\x00\x04\x00" + bytes([packed_field])
+            self.assertEqual(gif.extract_image_descriptor(data), (1, 2, 3, 4) + expected)
+
+
+class TestImageDescriptorSearch(unittest.TestCase):
+    def setUp(self):
+        self.data = _build_gif(2, 1, 1, 2, _pack_codes([(4, 3), (1, 3), (2, 3), (5, 3)]))
+        self.image = [[[85, 85, 85], [170, 170, 170]]]
+
+    def test_comment_containing_image_separator(self):
+        # comment extension before the image descriptor whose text holds 2C bytes
+        comment = b"\x21\xfe\x03,,,\x02\x2c\x2c\x00"
+        data = self.data[:25] + comment + self.data[25:]
+        self.assertEqual(gif.extract_image_descriptor(data), (0, 0, 2, 1, 0, 0, 0, 0, 0))
+        self.assertEqual(gif.extract_image(data), self.image)
+
+    def test_no_image(self):
+        data = self.data[:25] + b"\x3b"
+        with self.assertRaises(ValueError):
+            gif.extract_image_descriptor(data)
+        with self.assertRaises(ValueError):
+            gif.extract_image(data)
+
+    def test_missing_trailer(self):
+        self.assertEqual(gif.extract_frames(self.data[:-1]), [self.image])
+        # an image cut off inside its data sub blocks is left out
+        self.assertEqual(gif.extract_frames(self.data[:-1] + self.data[25:-3]), [self.image])
+
+
+class TestClearCodes(unittest.TestCase):
+    def test_repeated_clear_code(self):
+        for min_code_size in (2, 8):
+            cc_index = 2 ** min_code_size
+            code_size = min_code_size + 1
+            codes = [(cc_index, code_size), (cc_index, code_size), (1, code_size), (0, code_size),
+                     (cc_index + 1, code_size)]
+            data = _build_gif(2, 1, 1, min_code_size, _pack_codes(codes))
+            self.assertEqual(gif.extract_image(data), [[[85, 85, 85], [0, 0, 0]]])
+
+    def test_clear_code_then_eoi(self):
+        codes = [(4, 3), (5, 3)]
+        data = _build_gif(2, 1, 1, 2, _pack_codes(codes))
+        self.assertEqual(gif.extract_image(data), [[[0, 0, 0], [0, 0, 0]]])
+
+
+class TestLocalColourTable(unittest.TestCase):
+    def test_extract_image_uses_local_colour_table(self):
+        codes = [(4, 3), (1, 3), (0, 3), (5, 3)]
+        data = _build_gif(2, 1, 1, 2, _pack_codes(codes))
+        # give the image a 4 colour local colour table -> packed field byte is the 10th byte of the image descriptor
+        start = gif._find_image_descriptor(data, 25)
+        local_table = bytes(range(100, 112))
+        data = data[:start + 9] + b"\x81" + local_table + data[start + 10:]
+        self.assertEqual(gif.extract_image(data), [[[103, 104, 105], [100, 101, 102]]])
+        self.assertEqual(gif.extract_image(data), gif.extract_frame(data, 0))
+
+
+class TestColourLookup(unittest.TestCase):
+    def test_index_past_colour_table_is_black(self):
+        # 2 colour global colour table with min_code_size 2, so index 3 has no colour
+        codes = [(4, 3), (1, 3), (3, 3), (5, 3)]
+        data = _build_gif(2, 1, 0, 2, _pack_codes(codes))
+        self.assertEqual(gif.extract_image(data), [[[255, 255, 255], [0, 0, 0]]])
+
+
+class TestFrames(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        grey = [[0, 0, 0], [85, 85, 85], [170, 170, 170], [255, 255, 255]]
+        local = bytes(range(100, 112))
+        frames = []
+        self.expected = []
+        for f in range(5):
+            indexes = [rng.randrange(4) for _ in range(60 * 40)]
+            local_table = local if f % 2 else b""
+            colours = [list(local[3 * i:3 * i + 3]) for i in range(4)] if local_table else grey
+            frames.append((indexes, local_table))
+            self.expected.append([[colours[i] for i in indexes[r:r + 60]] for r in range(0, 60 * 40, 60)])
+        self.data = _build_animation(60, 40, frames)
+
+    def test_serial(self):
+        with mock.patch.object(gif.os, "cpu_count", return_value=1):
+            self.assertEqual(gif.extract_frames(self.data), self.expected)
+
+    @unittest.skipIf(gif._lzw_gif is None, "lzw_gif.so is not built")
+    def test_thread_pool(self):
+        with mock.patch.object(gif.os, "cpu_count", return_value=4), \
+                mock.patch.object(gif, "ThreadPoolExecutor", wraps=gif.ThreadPoolExecutor) as executor:
+            self.assertEqual(gif.extract_frames(self.data), self.expected)
+        executor.assert_called_once_with(max_workers=4)
+
+    def test_extract_frame(self):
+        for frame_idx, image in enumerate(self.expected):
+            self.assertEqual(gif.extract_frame(self.data, frame_idx), image)
+        self.assertEqual(gif.extract_image(self.data), self.expected[0])
+
+
+class TestDecoders(unittest.TestCase):
+    @unittest.skipUnless(os.environ.get("GIF_REQUIRE_NATIVE"), "native decoder not required, run make test")
+    def test_native_decoder_is_loaded(self):
+        self.assertIsNotNone(gif._lzw_gif)
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.noise = [rng.randrange(4) for _ in range(50000)]
+        self.runs = [i // 7 % 256 for i in range(50000)]
+
+    def decoders(self):
+        yield gif._lzw_decode
+        if gif._lzw_gif is not None:
+            yield lambda payload, min_code_size, size: gif._lzw_decode_native(bytearray(payload), min_code_size, size)
+
+    def assertDecodes(self, payload, min_code_size, size, expected):
+        for decode in self.decoders():
+            self.assertEqual(decode(payload, min_code_size, size), bytearray(expected))
+
+    def assertRejects(self, payload, min_code_size, size):
+        for decode in self.decoders():
+            with self.assertRaises(ValueError):
+                decode(payload, min_code_size, size)
+
+    def test_clear_codes_mid_stream(self):
+        payload = _lzw_encode(self.runs, 8, True)
+        self.assertDecodes(payload, 8, len(self.runs), self.runs)
+
+    def test_full_code_table_without_clear_code(self):
+        for indexes, min_code_size in ((self.noise, 2), (self.runs, 8)):
+            payload = _lzw_encode(indexes, min_code_size, False)
+            self.assertDecodes(payload, min_code_size, len(indexes), indexes)
+
+    def test_min_code_size_larger_than_colour_table(self):
+        indexes = [i % 2 for i in range(1000)]
+        payload = _lzw_encode(indexes, 8, True)
+        self.assertDecodes(payload, 8, len(indexes), indexes)
+
+    def test_extra_indexes_are_dropped(self):
+        payload = _lzw_encode(self.noise, 2, True)
+        self.assertDecodes(payload, 2, 1001, self.noise[:1001])
+
+    def test_missing_eoi_keeps_decoded_indexes(self):
+        payload = _pack_codes([(4, 3), (1, 3), (2, 3)])
+        self.assertDecodes(payload, 2, 4, [1, 2, 0, 0])
+
+    def test_stream_without_leading_clear_code(self):
+        payload = _pack_codes([(1, 3), (1, 3), (6, 3), (5, 3)])
+        self.assertDecodes(payload, 2, 5, [1, 1, 1, 1, 0])
+
+    def test_invalid_streams(self):
+        # code past the next free code table entry
+        self.assertRejects(_pack_codes([(4, 3), (1, 3), (7, 3), (5, 3)]), 2, 4)
+        # first code after CC is not a colour index
+        self.assertRejects(_pack_codes([(4, 3), (6, 3), (5, 3)]), 2, 4)
+        self.assertRejects(_pack_codes([(2, 2), (3, 2)]), 1, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()